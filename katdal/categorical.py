@@ -18,6 +18,7 @@
 
 import collections
 
+import numba
 import numpy as np
 from dask.base import tokenize
 
@@ -201,6 +202,48 @@ def unique_in_order(elements, return_inverse=False):
         if return_inverse else unique_elements
 
 
+@numba.jit(nopython=True)
+def _nearest_indices(queries, targets):
+    """Find index of nearest target for each query, with both sequences sorted.
+
+    This is equivalent to ``np.abs(targets - queries[:, np.newaxis]).argmin(axis=1)``
+    (including the preference for the lowest index in case of ties) but
+    runs in linear time and without a quadratic temporary array.
+
+    Parameters
+    ----------
+    queries : array of int, shape (*N*,)
+        Monotonically increasing sequence of query values
+    targets : array of int, shape (*M*,), with *M* > 0
+        Monotonically increasing sequence of target values
+
+    Returns
+    -------
+    nearest : array of int, shape (*N*,)
+        Index into `targets` of the element closest to each query
+
+    """
+    nearest = np.empty(len(queries), dtype=np.int64)
+    # Index of first target >= query (only moves forward as queries are sorted)
+    above = 0
+    for i in range(len(queries)):
+        query = queries[i]
+        while above < len(targets) and targets[above] < query:
+            above += 1
+        if above == 0:
+            nearest[i] = 0
+            continue
+        below = above - 1
+        if above < len(targets) and targets[above] - query < query - targets[below]:
+            nearest[i] = above
+            continue
+        # Pick the first of any repeated targets, like argmin does
+        while below > 0 and targets[below - 1] == targets[below]:
+            below -= 1
+        nearest[i] = below
+    return nearest
+
+
 # -------------------------------------------------------------------------------------------------
 # -- CLASS :  CategoricalData
 # -------------------------------------------------------------------------------------------------
@@ -353,8 +396,7 @@ class CategoricalData:
         """Turn list of bools per unique value into an array of bools per dump."""
         bool_per_event = np.atleast_1d(np.array(bool_per_value)[self.indices])
         bool_per_dump = np.empty(self.events[-1], dtype=np.bool)
-        for n, (start, end) in enumerate(zip(self.events[:-1], self.events[1:])):
-            bool_per_dump[start:end] = bool_per_event[n]
+        bool_per_dump[self.events[0]:] = np.repeat(bool_per_event, np.diff(self.events))
         return bool_per_dump
 
     def __eq__(self, other):
@@ -472,13 +514,13 @@ class CategoricalData:
         """
         # Identify unmatched segment starts
         segments = np.asarray(segments)
-        unmatched = segments[np.abs(self.events[np.newaxis, :] - segments[:, np.newaxis]).min(axis=1) > match_dist]
+        nearest_events = self.events[_nearest_indices(segments, self.events)]
+        unmatched = np.unique(segments[np.abs(nearest_events - segments) > match_dist])
         # Add these dumps as duplicate events, ignoring those that are out of bounds
-        for segm in unmatched:
-            try:
-                self.add(segm)
-            except IndexError:
-                pass
+        unmatched = unmatched[(unmatched >= self.events[0]) & (unmatched < self.events[-1])]
+        positions = self.events.searchsorted(unmatched)
+        self.indices = np.insert(self.indices, positions, self._lookup(unmatched))
+        self.events = np.insert(self.events, positions, unmatched)
 
     def align(self, segments):
         """Align sensor events with segment starts, possibly discarding events.
@@ -498,7 +540,8 @@ class CategoricalData:
 
         """
         # For each event, pick the segment with the closest start to it and then shift event onto segment start
-        segments_with_event = np.abs(self.events[np.newaxis, :] - segments[:, np.newaxis]).argmin(axis=0)
+        segments = np.asarray(segments)
+        segments_with_event = _nearest_indices(self.events, segments)
         events = segments[segments_with_event]
         # When multiple sensor events are associated with the same segment, only keep the final one
         final = np.nonzero(np.diff(events) > 0)[0]
@@ -603,6 +646,7 @@ def concatenate_categorical(split_data, **kwargs):
     return data
 
 
+@numba.jit(nopython=True)
 def _single_event_per_dump(events, greedy):
     """Ensure that each dump is associated with a single sensor event.
 
@@ -613,29 +657,32 @@ def _single_event_per_dump(events, greedy):
     "greedy" will override non-greedy ones and grab a dump even if it is not
     the final value. In this scenario, move the final (non-greedy) event to the
     next dump by modifying its dump index in the `events` parameter. The
-    generator returns up to *N* events but not the special terminal event.
+    function returns up to *N* events but not the special terminal event.
 
     Parameters
     ----------
-    events : mutable sequence of non-negative ints, length *N* + 1
+    events : array of non-negative int, shape (*N* + 1,)
         Monotonic sequence of dump indices associated with each sensor event.
         The last event is one past the last dump (i.e. the total number of
         dumps). Be aware that this parameter is mutated by the function.
-    greedy : sequence of bool, length *N*
+    greedy : array of bool, shape (*N*,)
         Flags indicating whether the sensor value at a given event is "greedy"
 
-    Yields
-    ------
-    event_index : non-negative int
-        Index into `events` sequence of the next cleaned up event (does not
-        yield the one-past-last-dump terminal event)
+    Returns
+    -------
+    cleaned_up : array of non-negative int, shape (*K*,) with *K* <= *N*
+        Indices into `events` sequence of the cleaned up events (excluding
+        the one-past-last-dump terminal event)
 
     """
+    cleaned_up = np.empty(len(events), dtype=np.int64)
+    num_cleaned_up = 0
     # The previous winning event is the dominant event in the previous dump
     previous_winning_event = 0
     previous_dump = 0
-    # This generates consecutive event indices with associated dump indices
-    for current_event, current_dump in enumerate(events):
+    # This iterates over consecutive event indices with associated dump indices
+    for current_event in range(len(events)):
+        current_dump = events[current_event]
         # At the start of a new dump, process the events of the previous dump
         if current_dump > previous_dump:
             # This previous event segment is assumed to straddle dump boundary
@@ -645,23 +692,26 @@ def _single_event_per_dump(events, greedy):
             if not greedy[previous_winning_event]:
                 previous_winning_event = event_at_dump_start
             winning_dump = events[previous_winning_event]
-            # Only yield winning event in immediate past to avoid duplicates
+            # Only keep winning event in immediate past to avoid duplicates
             if previous_dump <= winning_dump < current_dump:
-                yield previous_winning_event
+                cleaned_up[num_cleaned_up] = previous_winning_event
+                num_cleaned_up += 1
             # If winning event was greedy and final event was non-greedy,
-            # push final event to the start of next dump and yield if it is
+            # push final event to the start of next dump and keep it if it is
             # the only event in that dump (otherwise it has to fight it out...)
             if event_at_dump_start != previous_winning_event:
                 # NB: This modifies `events`! It simplifies bookkeeping.
                 events[event_at_dump_start] += 1
                 if current_dump > events[event_at_dump_start]:
-                    yield event_at_dump_start
+                    cleaned_up[num_cleaned_up] = event_at_dump_start
+                    num_cleaned_up += 1
                 previous_winning_event = event_at_dump_start
             previous_dump = current_dump
         # While within the same dump, pick the latest greedy event as winner
         # Also, avoid indexing greedy with final one-past-last event
         if (current_event < len(greedy)) and greedy[current_event]:
             previous_winning_event = current_event
+    return cleaned_up[:num_cleaned_up]
 
 
 def sensor_to_categorical(sensor_timestamps, sensor_values, dump_midtimes,
@@ -713,10 +763,12 @@ def sensor_to_categorical(sensor_timestamps, sensor_values, dump_midtimes,
     """
     sensor_timestamps = np.atleast_1d(sensor_timestamps)
     sensor_values = np.atleast_1d(sensor_values)
-    dump_endtimes = dump_midtimes + 0.5 * dump_period
-    num_dumps = len(dump_endtimes)
+    num_dumps = len(dump_midtimes)
     # Insert an extra prior dump to collect sensor values before first dump
-    dump_endtimes = np.r_[dump_endtimes[0] - dump_period, dump_endtimes]
+    # (fill a single array in place instead of concatenating afterwards)
+    dump_endtimes = np.empty(num_dumps + 1)
+    np.add(dump_midtimes, 0.5 * dump_period, out=dump_endtimes[1:])
+    dump_endtimes[0] = dump_endtimes[1] - dump_period
     # Check if sensor values are objects wrapped in ComparableArrayWrappers
     wrapped_values = len(sensor_values) and isinstance(sensor_values[0],
                                                        ComparableArrayWrapper)
@@ -741,7 +793,11 @@ def sensor_to_categorical(sensor_timestamps, sensor_values, dump_midtimes,
             def transform(value):   # noqa: E306
                 """Unwrap wrapped value, transform and rewrap."""
                 return ComparableArrayWrapper(orig_transform(value.unwrapped))
-        sensor_values = np.array([transform(y) for y in sensor_values])
+            sensor_values = np.array([transform(y) for y in sensor_values])
+        else:
+            # Only transform each unique value once (sensors tend to repeat values)
+            raw_values, raw_inverse = unique_in_order(sensor_values, return_inverse=True)
+            sensor_values = np.array([transform(y) for y in raw_values])[raw_inverse]
     # Force first dump to have valid sensor value
     # (insert initial value or let the first proper value apply from the start)
     if events[0] != 0 and initial_value is not None:
@@ -750,20 +806,24 @@ def sensor_to_categorical(sensor_timestamps, sensor_values, dump_midtimes,
         sensor_values = np.r_[[initial_value], sensor_values]
         events = np.r_[0, events]
     events[0] = 0
+    # Factorise sensor values so that each unique value is only inspected once
+    unique_values, inverse = unique_in_order(sensor_values, return_inverse=True)
     # Clean up dump->event mapping, taking into account greedy values
     greedy_values = () if greedy_values is None else greedy_values
-    greedy = [value in greedy_values for value in sensor_values]
+    greedy_per_value = np.array([value in greedy_values for value in unique_values],
+                                dtype=np.bool_)
+    greedy = greedy_per_value[inverse]
     # Add one-past-last-dump terminator (will be removed again by `cleaned_up`)
-    events = np.r_[events, num_dumps]
+    events = np.r_[events, num_dumps].astype(np.int64)
     # NB: `events` is mutated by `_single_event_per_dump`
-    cleaned_up = list(_single_event_per_dump(events, greedy))
+    cleaned_up = _single_event_per_dump(events, greedy)
     sensor_values = sensor_values[cleaned_up]
     events = events[cleaned_up]
     # Discard sensor events that do not change the (transformed) sensor value
     # (i.e. that repeat the previous value)
     if not allow_repeats:
-        changes_value = [n for n in range(len(sensor_values)) if n == 0 or
-                         sensor_values[n] != sensor_values[n - 1]]
+        inverse = inverse[cleaned_up]
+        changes_value = np.r_[True, inverse[1:] != inverse[:-1]]
         sensor_values = sensor_values[changes_value]
         events = events[changes_value]
     # Last event is fixed at one-past-last-dump to indicate end of last segment
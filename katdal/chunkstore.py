@@ -16,6 +16,7 @@
 
 """Base class for accessing a store of chunks (i.e. N-dimensional arrays)."""
 
+import concurrent.futures
 import contextlib
 import functools
 import io
@@ -158,6 +159,12 @@ def _scalar_to_chunk(func):
     return func_returning_chunk
 
 
+@functools.lru_cache(maxsize=None)
+def _chunk_id_format(ndim, width):
+    """Format string turning `ndim` chunk start indices into a chunk ID string."""
+    return '_'.join(ndim * [f'{{:0{width}d}}'])
+
+
 def npy_header_and_body(chunk):
     """Prepare a chunk for low-level writing.
 
@@ -251,6 +258,54 @@ class ChunkStore:
         """
         raise NotImplementedError
 
+    def get_chunks(self, requests, max_workers=64):
+        """Get multiple chunks from the store.
+
+        By default this runs individual :meth:`get_chunk` calls concurrently
+        on a pool of worker threads, which hides the latency of remote
+        stores. Stores may override this to retrieve chunks in bulk more
+        efficiently. If more than one request fails, the error of the first
+        failing request (in the order of `requests`) is raised.
+
+        Parameters
+        ----------
+        requests : iterable of tuple of (array_name, slices, dtype)
+            Chunk specifications, each a tuple of arguments to :meth:`get_chunk`
+        max_workers : int, optional
+            Maximum number of chunks to retrieve concurrently (1 means that
+            the chunks are retrieved one by one in the calling thread)
+
+        Returns
+        -------
+        chunks : list of :class:`numpy.ndarray` objects
+            Chunks in the same order as `requests`
+
+        Raises
+        ------
+        :exc:`chunkstore.BadChunk`
+            If any requested `dtype` does not match underlying parent array
+            dtype, `slices` has wrong specification or buffer has wrong size
+        :exc:`chunkstore.StoreUnavailable`
+            If interaction with chunk store failed (offline, bad auth, bad config)
+        :exc:`chunkstore.ChunkNotFound`
+            If any requested chunk was not found in store
+        """
+        requests = list(requests)
+        max_workers = min(max_workers, len(requests))
+        if max_workers <= 1:
+            return [self.get_chunk(array_name, slices, dtype)
+                    for array_name, slices, dtype in requests]
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(self.get_chunk, array_name, slices, dtype)
+                       for array_name, slices, dtype in requests]
+            try:
+                return [future.result() for future in futures]
+            finally:
+                # If a chunk failed, don't wait for the queued requests on exit
+                # (executor.shutdown(cancel_futures=True) needs Python 3.9)
+                for future in futures:
+                    future.cancel()
+
     def get_chunk_or_default(self, array_name, slices, dtype, default_value=0):
         """Get chunk from the store but return default value if it is missing."""
         try:
@@ -354,8 +409,35 @@ class ChunkStore:
     @classmethod
     def chunk_id_str(cls, slices):
         """Chunk identifier in string form (e.g. '00012_01024_00000')."""
-        return '_'.join("{:0{w}d}".format(s.start, w=cls.NAME_INDEX_WIDTH)
-                        for s in slices)
+        # A single cached format string beats joining per-index format() calls
+        # (generator or list) for the usual 3-D chunk IDs
+        id_format = _chunk_id_format(len(slices), cls.NAME_INDEX_WIDTH)
+        return id_format.format(*[s.start for s in slices])
+
+    @classmethod
+    def chunk_names(cls, array_name, slices_list):
+        """Full chunk names of many chunks in the same array.
+
+        This is equivalent to taking the `chunk_name` part of
+        :meth:`chunk_metadata` for each element of `slices_list` (without
+        the validation), but the name prefix is only formed once.
+
+        Parameters
+        ----------
+        array_name : string
+            Identifier of parent array `x` of chunks
+        slices_list : sequence of sequences of unit-stride slice objects
+            Identifiers of individual chunks, to be extracted as `x[slices]`
+
+        Returns
+        -------
+        chunk_names : list of string
+            Full chunk names, in the same order as `slices_list`
+        """
+        prefix = cls.join(array_name, '')
+        width = cls.NAME_INDEX_WIDTH
+        return [prefix + _chunk_id_format(len(slices), width).format(*[s.start for s in slices])
+                for slices in slices_list]
 
     @classmethod
     def chunk_metadata(cls, array_name, slices, chunk=None, dtype=None):
@@ -392,7 +474,8 @@ class ChunkStore:
 
         """
         try:
-            shape = tuple(s.stop - s.start for s in slices)
+            # A list comprehension is cheaper than a generator on this hot path
+            shape = tuple([s.stop - s.start for s in slices])
         except (TypeError, AttributeError):
             raise BadChunk(f'Array {array_name!r}: chunk ID should be '
                            f'a sequence of slice objects, not {slices}')
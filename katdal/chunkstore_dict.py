@@ -16,7 +16,11 @@
 
 """A store of chunks (i.e. N-dimensional arrays) based on a dict of arrays."""
 
-from .chunkstore import BadChunk, ChunkNotFound, ChunkStore
+import collections
+
+import numpy as np
+
+from .chunkstore import BadChunk, ChunkNotFound, ChunkStore, ChunkStoreError
 
 
 class DictChunkStore(ChunkStore):
@@ -47,6 +51,37 @@ class DictChunkStore(ChunkStore):
                            f'{chunk.shape} differs from expected dtype {dtype} and shape {shape}')
         return chunk
 
+    def get_chunks(self, requests, max_workers=64):
+        """See the docstring of :meth:`ChunkStore.get_chunks`."""
+        requests = list(requests)
+        chunks = len(requests) * [None]
+        # Look up each array and check its dtype only once
+        requests_per_array = collections.defaultdict(list)
+        for n, (array_name, slices, dtype) in enumerate(requests):
+            requests_per_array[array_name, np.dtype(dtype)].append((n, slices))
+        try:
+            for (array_name, dtype), array_requests in requests_per_array.items():
+                chunk_name, _ = self.chunk_metadata(array_name, array_requests[0][1], dtype=dtype)
+                with self._standard_errors(chunk_name):
+                    array = self.arrays[array_name]
+                if array.dtype != dtype:
+                    raise BadChunk(f'Chunk {chunk_name!r}: array dtype {array.dtype} '
+                                   f'differs from requested dtype {dtype}')
+                for n, slices in array_requests:
+                    chunk_name, shape = self.chunk_metadata(array_name, slices)
+                    with self._standard_errors(chunk_name):
+                        chunk = array[slices] if slices != () else array
+                    if chunk.shape != shape:
+                        raise BadChunk(f'Chunk {chunk_name!r}: actual shape {chunk.shape} '
+                                       f'differs from expected shape {shape}')
+                    chunks[n] = chunk
+        except ChunkStoreError:
+            # The failure might not be in the first failing request, since requests
+            # are grouped per array, so redo them in order to raise the right error
+            return [self.get_chunk(array_name, slices, dtype)
+                    for array_name, slices, dtype in requests]
+        return chunks
+
     def create_array(self, array_name):
         if array_name not in self.arrays:
             raise NotImplementedError
@@ -57,4 +92,5 @@ class DictChunkStore(ChunkStore):
         self.get_chunk(array_name, slices, chunk.dtype)[()] = chunk
 
     get_chunk.__doc__ = ChunkStore.get_chunk.__doc__
+    get_chunks.__doc__ = ChunkStore.get_chunks.__doc__
     put_chunk.__doc__ = ChunkStore.put_chunk.__doc__
@@ -100,6 +100,12 @@ class NpyFileChunkStore(ChunkStore):
                            f'{chunk.shape} differs from expected dtype {dtype} and shape {shape}')
         return chunk
 
+    def get_chunks(self, requests, max_workers=4):
+        """See the docstring of :meth:`ChunkStore.get_chunks`."""
+        # Local disk gains little from many concurrent reads (unlike S3),
+        # so use fewer threads by default
+        return super().get_chunks(requests, max_workers)
+
     def create_array(self, array_name):
         """See the docstring of :meth:`ChunkStore.create_array`."""
         # Ensure any subdirectories are in place
@@ -134,6 +140,7 @@ class NpyFileChunkStore(ChunkStore):
         return os.path.isfile(touch_file)
 
     get_chunk.__doc__ = ChunkStore.get_chunk.__doc__
+    get_chunks.__doc__ = ChunkStore.get_chunks.__doc__
     put_chunk.__doc__ = ChunkStore.put_chunk.__doc__
     mark_complete.__doc__ = ChunkStore.mark_complete.__doc__
     is_complete.__doc__ = ChunkStore.is_complete.__doc__
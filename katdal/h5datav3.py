@@ -112,6 +112,19 @@ def dummy_dataset(name, shape, dtype, value):
                                      dtype=dtype, fillvalue=value, compression='gzip')
 
 
+def _parse_obs_params(obs_params):
+    """Turn sequence of "key value" strings into dict of observation parameters.
+
+    Empty strings are ignored and each value string is safely evaluated.
+    """
+    obs_params = np.asarray(to_str(np.asarray(obs_params)), dtype=str)
+    obs_params = obs_params[obs_params != '']
+    # Split all parameters into keys and values in one go
+    keys, _, vals = np.char.partition(obs_params, ' ').reshape(-1, 3).T
+    return {key: np.lib.utils.safe_eval(val)
+            for key, val in zip(keys.tolist(), vals.tolist())}
+
+
 class _AttributeFound(Exception):
     """This indicates that an attribute has been found and contains its value."""
 
@@ -365,10 +378,7 @@ class H5DataV3(DataSet):
                                              extract=False).get().value
             except KeyError:
                 obs_params = []
-            for obs_param in obs_params:
-                if obs_param:
-                    key, val = obs_param.split(' ', 1)
-                    self.obs_params[key] = np.lib.utils.safe_eval(val)
+            self.obs_params = _parse_obs_params(obs_params)
         # Get observation script parameters, with defaults
         self.observer = self.obs_params.get('observer', '')
         self.description = self.obs_params.get('description', '')
@@ -400,7 +410,7 @@ class H5DataV3(DataSet):
         # Original list of correlation products as pairs of input labels
         corrprods = self._get_corrprods(f, self.stream_name)
         # Find names of all antennas with associated correlator data
-        cbf_ants = set([cp[0][:-1] for cp in corrprods] + [cp[1][:-1] for cp in corrprods])
+        cbf_ants = {inp[:-1] for inp in np.unique(corrprods).tolist()}
         # By default, only pick antennas that were in use by the script
         obs_ants = self.obs_params.get('ants')
         # Otherwise fall back to the list of antennas common to CAM and CBF
@@ -816,7 +826,7 @@ class H5DataV3(DataSet):
         # Original list of correlation products as pairs of input labels
         corrprods = H5DataV3._get_corrprods(f, stream_name)
         # Find names of all antennas with associated correlator data
-        cbf_ants = set([cp[0][:-1] for cp in corrprods] + [cp[1][:-1] for cp in corrprods])
+        cbf_ants = {inp[:-1] for inp in np.unique(corrprods).tolist()}
         # obs_params is a telstate attribute in v3.9 so try that first
         obs_params = {}
         if 'capture_block_id' in f.attrs:
@@ -827,11 +837,7 @@ class H5DataV3(DataSet):
         # Fall back to old obs_params location
         else:
             tm_params = tm_group['obs/params']
-            for obs_param in tm_params['value']:
-                if obs_param:
-                    obs_param = to_str(obs_param)
-                    key, val = obs_param.split(' ', 1)
-                    obs_params[key] = np.lib.utils.safe_eval(val)
+            obs_params = _parse_obs_params(tm_params['value'])
         # By default, only pick antennas that were in use by the script
         obs_ants = obs_params.get('ants')
         # Otherwise fall back to the list of antennas common to CAM and CBF
@@ -16,6 +16,7 @@
 
 """Container that stores cached (interpolated) and uncached (raw) sensor data."""
 
+import functools
 import logging
 import re
 import threading
@@ -443,6 +444,22 @@ def get_sensor_from_katstore(store, name, start_time, end_time):
         return RecordSensorGetter(samples, name)
 
 
+@functools.lru_cache(maxsize=None)
+def _wildcard_regex(key):
+    """Compile sensor name pattern with ``*`` wildcards into a regex."""
+    regex = '.*'.join(re.escape(part) for part in key.split('*'))
+    return re.compile('^' + regex + '$')
+
+
+@functools.lru_cache(maxsize=None)
+def _virtual_sensor_regex(pattern):
+    """Compile virtual sensor template into a regex with named variables."""
+    # Expand variable names enclosed in braces to the relevant regular expression
+    # (match anything but slashes, which are preferred delimiters in virtual sensor names)
+    return re.compile(re.sub(r'(\{[a-zA-Z_]\w*\})',
+                             lambda m: '(?P<{}>[^/]+)'.format(m.group(0)[1:-1]), pattern))
+
+
 def dummy_sensor_getter(name, value=None, dtype=np.float64, timestamp=0.0):
     """Create a SensorGetter object with a single default value based on type.
 
@@ -723,10 +740,8 @@ class SensorCache(MutableMapping):
         props = prop_map.setdefault(name, {})
         # Look up properties associated with this class of sensor
         for key, val in prop_map.items():
-            if '*' in key:
-                regex = '.*'.join(re.escape(part) for part in key.split('*'))
-                if re.match('^' + regex + '$', name):
-                    props.update(val)
+            if '*' in key and _wildcard_regex(key).match(name):
+                props.update(val)
         # Any properties passed directly to this method takes precedence
         props.update(kwargs)
         return props
@@ -837,11 +852,7 @@ class SensorCache(MutableMapping):
             except KeyError:
                 # Otherwise, iterate through virtual sensor templates and look for a match
                 for pattern, create_sensor in self.virtual.items():
-                    # Expand variable names enclosed in braces to the relevant regular expression
-                    # (match anything but slashes, which are preferred delimiters in virtual sensor names)
-                    pattern = re.sub(r'(\{[a-zA-Z_]\w*\})',
-                                     lambda m: '(?P<{}>[^/]+)'.format(m.group(0)[1:-1]), pattern)
-                    match = re.match(pattern, name)
+                    match = _virtual_sensor_regex(pattern).match(name)
                     if match:
                         # Call sensor creation function with extracted variables from sensor name
                         sensor_data = create_sensor(self, name, **match.groupdict())
@@ -854,6 +865,8 @@ class SensorCache(MutableMapping):
                         end_time = self.timestamps[-1] + self.dump_period + 60
                         sensor_data = get_sensor_from_katstore(
                             self.store, name, start_time, end_time)
+                        # Avoid querying the sensor store again for this sensor
+                        self._raw[name] = sensor_data
                     else:
                         raise KeyError(f"Unknown sensor '{name}' (does not match actual name or "
                                        "virtual template and no sensor store provided)")
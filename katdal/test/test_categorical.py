@@ -19,7 +19,8 @@
 import numpy as np
 from numpy.testing import assert_array_equal
 
-from katdal.categorical import _single_event_per_dump, sensor_to_categorical
+from katdal.categorical import (CategoricalData, _nearest_indices,
+                                _single_event_per_dump, sensor_to_categorical)
 
 
 def test_dump_to_event_parsing():
@@ -48,3 +49,46 @@ def test_categorical_sensor_creation():
                        'Sensor->categorical failed')
     assert_array_equal(categ.indices, [0, 1, 0, 1, 0],
                        'Sensor->categorical failed')
+    slewing = np.array(2 * [True] + 4 * [False] + [True] + 4 * [False] + [True])
+    assert_array_equal(categ == 'slew', slewing)
+    assert_array_equal(categ != 'slew', ~slewing)
+
+
+def test_categorical_sensor_transform():
+    timestamps = [-363.784, 2.467, 8.839, 8.867, 15.924, 48.925, 54.897, 88.982]
+    values = ['stop', 'slew', 'track', 'slew', 'track', 'slew', 'track', 'slew']
+    dump_period = 8.
+    dump_times = np.arange(4., 100., dump_period)
+    transformed = []
+
+    def transform(value):
+        transformed.append(value)
+        return 'moving' if value == 'slew' else value
+    categ = sensor_to_categorical(timestamps, values, dump_times, dump_period,
+                                  transform=transform, greedy_values=('moving', 'stop'),
+                                  initial_value='moving')
+    # Each unique value is only transformed once
+    assert_array_equal(sorted(transformed), ['slew', 'stop', 'track'])
+    assert_array_equal(categ.unique_values, ['moving', 'track'])
+    assert_array_equal(categ.events, [0, 2, 6, 7, 11, 12])
+    assert_array_equal(categ.indices, [0, 1, 0, 1, 0])
+
+
+def test_nearest_indices():
+    queries = np.array([-3, 0, 1, 2, 3, 4, 5, 7, 9, 12, 20])
+    targets = np.array([0, 2, 2, 6, 8, 8, 12])
+    expected = np.abs(targets - queries[:, np.newaxis]).argmin(axis=1)
+    assert_array_equal(_nearest_indices(queries, targets), expected)
+    assert_array_equal(_nearest_indices(queries[:0], targets), [])
+
+
+def test_categorical_align_and_add_unmatched():
+    scan = CategoricalData(['slew', 'track', 'slew', 'track'], [0, 2, 10, 12, 20])
+    label = CategoricalData(['a', 'b', 'c'], [0, 6, 11, 20])
+    scan.add_unmatched(label.events)
+    assert_array_equal(scan.events, [0, 2, 6, 10, 12, 20])
+    assert_array_equal(scan.indices, [0, 1, 1, 0, 1])
+    label.align(scan.events)
+    assert_array_equal(label.events, [0, 6, 10, 20])
+    assert_array_equal(label.indices, [0, 1, 2])
+    assert_array_equal(label.unique_values, ['a', 'b', 'c'])
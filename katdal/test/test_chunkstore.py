@@ -16,6 +16,8 @@
 
 """Tests for :py:mod:`katdal.chunkstore`."""
 
+import time
+
 import dask.array as da
 import numpy as np
 from nose.tools import (assert_equal, assert_false, assert_is_instance,
@@ -117,6 +119,22 @@ class TestChunkStore:
         assert_raises(BadChunk, store.chunk_metadata, "x", [slice(0, 2)],
                       dtype=np.dtype(np.object))
 
+    def test_chunk_id_str(self):
+        slices = (slice(12, 13), slice(1024, 2048), slice(0, 10))
+        assert_equal(ChunkStore.chunk_id_str(slices), '00012_01024_00000')
+        assert_equal(ChunkStore.chunk_id_str(slices[:1]), '00012')
+        assert_equal(ChunkStore.chunk_id_str(()), '')
+        chunk_name, shape = ChunkStore.chunk_metadata('x', slices)
+        assert_equal(chunk_name, 'x/00012_01024_00000')
+        assert_equal(shape, (1, 1024, 10))
+
+    def test_chunk_names(self):
+        slices_list = [(slice(12, 13), slice(1024, 2048)), (slice(0, 1), slice(0, 1024)),
+                       (slice(3, 4),), ()]
+        expected = [ChunkStore.chunk_metadata('x/y', slices)[0] for slices in slices_list]
+        assert_equal(ChunkStore.chunk_names('x/y', slices_list), expected)
+        assert_equal(ChunkStore.chunk_names('x/y', []), [])
+
     def test_standard_errors(self):
         error_map = {ZeroDivisionError: StoreUnavailable,
                      LookupError: ChunkNotFound}
@@ -128,6 +146,23 @@ class TestChunkStore:
             with store._standard_errors():
                 {}['ha']
 
+    def test_get_chunks_cancels_pending_requests_on_error(self):
+        requested = []
+
+        class SlowStore(ChunkStore):
+            def get_chunk(self, array_name, slices, dtype):
+                requested.append(array_name)
+                if array_name == 'missing':
+                    raise ChunkNotFound(array_name)
+                time.sleep(0.05)
+                return np.zeros(1, dtype)
+
+        requests = [('missing', (slice(0, 1),), np.int8)]
+        requests += 20 * [('x', (slice(0, 1),), np.int8)]
+        assert_raises(ChunkNotFound, SlowStore({}).get_chunks, requests, max_workers=2)
+        # Only the requests that were already running should have been completed
+        assert_true(len(requested) < len(requests) // 2)
+
 
 class ChunkStoreTestBase:
     """Standard tests performed on all types of ChunkStore."""
@@ -224,6 +259,34 @@ class ChunkStoreTestBase:
         # Try an empty slice on a zero-dimensional array (but why?)
         self.put_get_chunk('z', ())
 
+    def test_get_chunks(self):
+        name_x, name_y = self.array_name('x'), self.array_name('y')
+        s_x = (slice(3, 5),)
+        s_y1 = (slice(3, 7), slice(2, 5), slice(1, 2))
+        s_y2 = (slice(0, 2), slice(0, 6), slice(0, 2))
+        self.put_get_chunk('x', s_x)
+        self.put_get_chunk('y', s_y1)
+        self.put_get_chunk('y', s_y2)
+        requests = [(name_y, s_y1, self.y.dtype), (name_x, s_x, self.x.dtype),
+                    (name_y, s_y2, self.y.dtype)]
+        chunks = self.store.get_chunks(requests)
+        assert_equal(len(chunks), len(requests))
+        assert_array_equal(chunks[0], self.y[s_y1])
+        assert_array_equal(chunks[1], self.x[s_x])
+        assert_array_equal(chunks[2], self.y[s_y2])
+        serial_chunks = self.store.get_chunks(requests, max_workers=1)
+        for chunk, serial_chunk in zip(chunks, serial_chunks):
+            assert_array_equal(chunk, serial_chunk)
+        assert_equal(self.store.get_chunks([]), [])
+        assert_raises(BadChunk, self.store.get_chunks, [(name_x, s_x, self.y.dtype)])
+        missing = (self.array_name('haha'), (slice(0, 1),), np.dtype(np.float64))
+        assert_raises(ChunkNotFound, self.store.get_chunks, [missing])
+        assert_raises(ChunkNotFound, self.store.get_chunks, iter(requests + [missing]))
+        # The error of the first failing request is raised, even if in a later array
+        assert_raises(ChunkNotFound, self.store.get_chunks,
+                      [requests[0], missing, (name_y, (slice(0, 4, 2),), self.y.dtype)])
+        assert_equal(len(self.store.get_chunks(iter(requests))), len(requests))
+
     def test_put_chunk_noraise(self):
         name = self.array_name('x')
         self.store.create_array(name)
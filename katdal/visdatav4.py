@@ -182,6 +182,24 @@ def _normalise_cal_products(products, cal_streams):
                              'or <stream>.<product_type>')
     return normalised_cal_products, skip_missing_products
 
+
+def _contiguous_index(keep):
+    """Turn boolean selection mask into equivalent slice if it is contiguous."""
+    selected = np.flatnonzero(keep)
+    if len(selected) == 0:
+        return slice(0, 0)
+    start, stop = selected[0], selected[-1] + 1
+    return slice(start, stop) if stop - start == len(selected) else keep
+
+
+def _drop_first_event(sensor):
+    """Discard first event of categorical `sensor`, letting the next one start at dump 0.
+
+    The event and index arrays are replaced by views, so nothing is copied.
+    """
+    sensor.events, sensor.indices = sensor.events[1:], sensor.indices[1:]
+    sensor.events[0] = 0
+
 # -----------------------------------------------------------------------------
 # -- CLASS :  VisibilityDataV4
 # -----------------------------------------------------------------------------
@@ -234,7 +252,7 @@ class VisibilityDataV4(DataSet):
         # ------ Extract timestamps ------
 
         def _before(date):
-            return source.timestamps[0] < katpoint.Timestamp(date).secs
+            return timestamps[0] < katpoint.Timestamp(date).secs
 
         self.source = source
         self.file = {}
@@ -250,11 +268,14 @@ class VisibilityDataV4(DataSet):
         else:
             cbf_dumps_per_sdp_dump = round(self.dump_period / self.cbf_dump_period)
             self.accumulations_per_dump = cbf_n_accs * cbf_dumps_per_sdp_dump
-        num_dumps = len(source.timestamps)
-        source.timestamps += self.time_offset
+        # Leave the source timestamps untouched (and uncopied if there is no offset)
+        timestamps = np.asarray(source.timestamps)
+        num_dumps = len(timestamps)
+        if self.time_offset:
+            timestamps = timestamps + self.time_offset
         if _before('2000-01-01'):
             logger.warning("Data set has invalid first correlator timestamp "
-                           "(%f)", source.timestamps[0])
+                           "(%f)", timestamps[0])
         # Workaround for one-CBF-dump offset (SR-1625), reflecting these updates:
         # - CMC2 aka cbf_dev_N 4k fixed since at least 2019-02-11
         # - CMC2 aka cbf_dev_N 1k fixed since at least 2019-03-03
@@ -265,7 +286,7 @@ class VisibilityDataV4(DataSet):
             or _before('2019-03-03') and not (cmc2 and cbf4k)
                 or _before('2019-03-15') and not cmc2):
             if self.cbf_dump_period is not None:
-                source.timestamps -= self.cbf_dump_period
+                timestamps = timestamps - self.cbf_dump_period
                 # Record workaround in time_offset to make it easy to verify
                 self.time_offset -= self.cbf_dump_period
                 logger.info('Corrected data timestamps backwards by 1 CBF dump '
@@ -274,13 +295,17 @@ class VisibilityDataV4(DataSet):
                 logger.warning('Could not correct timestamps as CBF int time is unknown:'
                                ' consider using full RDB or explicit time_offset')
         half_dump = 0.5 * self.dump_period
-        self.start_time = katpoint.Timestamp(source.timestamps[0] - half_dump)
-        self.end_time = katpoint.Timestamp(source.timestamps[-1] + half_dump)
+        self.start_time = katpoint.Timestamp(timestamps[0] - half_dump)
+        self.end_time = katpoint.Timestamp(timestamps[-1] + half_dump)
+        self._timestamps = timestamps
         self._time_keep = np.full(num_dumps, True, dtype=np.bool_)
-        all_dumps = [0, num_dumps]
+        self._time_index = slice(0, num_dumps)
+        # Constant sensors all share one (read-only) events array
+        all_dumps = np.array([0, num_dumps])
+        all_dumps.setflags(write=False)
 
         # Assemble sensor cache
-        self.sensor = SensorCache(source.metadata.sensors, source.timestamps,
+        self.sensor = SensorCache(source.metadata.sensors, self._timestamps,
                                   self.dump_period, self._time_keep,
                                   SENSOR_PROPS, VIRTUAL_SENSORS, SENSOR_ALIASES,
                                   sensor_store)
@@ -327,8 +352,8 @@ class VisibilityDataV4(DataSet):
         ants = sorted(ants)
         cam_ants = {ant.name for ant in ants}
         # Find names of all antennas with associated correlator data
-        sdp_ants = set([cp[0][:-1] for cp in corrprods] +
-                       [cp[1][:-1] for cp in corrprods])
+        # (strip polarisation from unique inputs instead of every corrprod)
+        sdp_ants = {inp[:-1] for inp in np.unique(corrprods).tolist()}
         # By default, only pick antennas that were in use by the script
         obs_ants = self.obs_params.get('ants')
         # Otherwise fall back to the list of antennas common to CAM and SDP / CBF
@@ -375,7 +400,7 @@ class VisibilityDataV4(DataSet):
         # Get the receiver band identity ('l', 's', 'u', 'x')
         band = attrs['sub_band']
         # Populate antenna -> receiver mapping and figure out noise diode
-        for ant in cam_ants:
+        for ant in sorted(cam_ants):
             # Try sanitised version of RX serial number first
             rx_serial = attrs.get(f'{ant}_rsc_rx{band}_serial_number', 0)
             self.receivers[ant] = f'{band}.{rx_serial}'
@@ -424,8 +449,7 @@ class VisibilityDataV4(DataSet):
         # The workaround avoids putting the first dump in a scan by itself,
         # typically with an irrelevant target.
         if len(scan) > 1 and scan.events[1] == 1 and scan[1] == 'slew':
-            scan.events, scan.indices = scan.events[1:], scan.indices[1:]
-            scan.events[0] = 0
+            _drop_first_event(scan)
         # Use labels to partition the data set into compound scans
         try:
             label = self.sensor.get('obs_label')
@@ -474,9 +498,7 @@ class VisibilityDataV4(DataSet):
             # Only remove initial target event if we move to a different target
             if target[segment.start] is not target[0]:
                 # Only lose 1 event because target sensor doesn't allow repeats
-                target.events = target.events[1:]
-                target.indices = target.indices[1:]
-                target.events[0] = 0
+                _drop_first_event(target)
                 # Remove initial target from target.unique_values if not used
                 target.align(target.events)
             break
@@ -618,6 +640,9 @@ class VisibilityDataV4(DataSet):
 
         """
         super()._set_keep(time_keep, freq_keep, corrprod_keep, weights_keep, flags_keep)
+        if time_keep is not None:
+            # Avoid boolean indexing of timestamps for contiguous time selections
+            self._time_index = _contiguous_index(self._time_keep)
         if not self.source.data:
             self._vis = self._weights = self._flags = self._raw_flags = self._excision = None
             return
@@ -668,7 +693,9 @@ class VisibilityDataV4(DataSet):
         *midpoint*.
 
         """
-        return self.source.timestamps[self._time_keep]
+        timestamps = self._timestamps[self._time_index]
+        # A slice produces a view, so copy it to protect the shared timestamps
+        return timestamps.copy() if isinstance(self._time_index, slice) else timestamps
 
     @property
     def vis(self):